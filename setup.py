@@ -33,6 +33,9 @@ setup(
     install_requires=[
         "mcp>=0.9.0",
     ],
+    extras_require={
+        "uvloop": ["uvloop>=0.18.0; sys_platform != 'win32'"],
+    },
     entry_points={
         "console_scripts": [
             "mcp-echo=mcp_echo.server:main",
@@ -2,10 +2,19 @@
 """
 Echo MCP Server
 一个简单的MCP服务器，提供echo工具：输入什么返回什么
+
+工具处理函数不得原地修改传入的arguments，并且每次返回新构建的列表；
+字符串等不可变的输入可以直接放进结果中共享。静态的工具列表_TOOLS
+在各次请求间共享，任何代码都不得修改它。遵守这些约定后，请求处理
+全程无需复制数据。
 """
 
 import asyncio
+import atexit
 import logging
+import logging.handlers
+import queue
+import time
 from typing import Any
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
@@ -21,8 +30,24 @@ logger = logging.getLogger("echo-server")
 # 创建服务器实例
 app = Server("echo-server")
 
-# 用于确保请求按顺序处理的锁
-_request_lock = asyncio.Lock()
+
+# 工具列表是静态的，只在导入时构建一次
+_TOOLS = [
+    Tool(
+        name="echo",
+        description="输入什么就返回什么的echo工具。可以用来测试MCP连接或简单地回显文本。",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "message": {
+                    "type": "string",
+                    "description": "要回显的消息内容"
+                }
+            },
+            "required": ["message"]
+        }
+    )
+]
 
 
 @app.list_tools()
@@ -30,64 +55,97 @@ async def list_tools() -> list[Tool]:
     """
     列出可用的工具
     """
+    return _TOOLS
+
+
+def echo(arguments: dict) -> list[TextContent]:
+    """
+    echo工具：原样返回message参数
+    """
+    # message是schema中的必填参数，直接取值
+    try:
+        message = arguments["message"]
+    except KeyError:
+        raise ValueError("缺少必填参数: message") from None
+    
+    # 字符串不可变，直接返回即可；只有非字符串输入才需要转换
+    if not isinstance(message, str):
+        message = str(message)
+    
     return [
-        Tool(
-            name="echo",
-            description="输入什么就返回什么的echo工具。可以用来测试MCP连接或简单地回显文本。",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "message": {
-                        "type": "string",
-                        "description": "要回显的消息内容"
-                    }
-                },
-                "required": ["message"]
-            }
+        TextContent(
+            type="text",
+            text=message
         )
     ]
 
 
+# 工具名称到处理函数的映射
+_TOOL_HANDLERS = {
+    "echo": echo,
+}
+
+
 @app.call_tool()
 async def call_tool(name: str, arguments: dict) -> list[TextContent]:
     """
     处理工具调用
-    使用锁确保并发请求不会相互干扰
     """
-    # 生成请求标识用于日志追踪
-    request_id = id(arguments)
-    logger.info(f"[请求 {request_id}] 收到工具调用: {name}, 参数: {arguments}")
+    start = time.perf_counter_ns()
+    logger.debug("参数: %s", arguments)
     
-    # 使用锁确保请求按顺序处理，避免并发时的响应混乱
-    async with _request_lock:
-        try:
-            if name == "echo":
-                message = arguments.get("message", "")
-                logger.info(f"[请求 {request_id}] 处理消息: {message}")
-                
-                # 复制消息内容，确保不共享引用
-                result = [
-                    TextContent(
-                        type="text",
-                        text=str(message)  # 确保是新的字符串对象
-                    )
-                ]
-                
-                logger.info(f"[请求 {request_id}] 返回结果: {message}")
-                return result
-            else:
-                error_msg = f"未知的工具: {name}"
-                logger.error(f"[请求 {request_id}] {error_msg}")
-                raise ValueError(error_msg)
-        except Exception as e:
-            logger.error(f"[请求 {request_id}] 处理失败: {str(e)}")
-            raise
+    # 每次调用只输出一条日志：成功为INFO，失败为ERROR并附带异常信息
+    try:
+        handler = _TOOL_HANDLERS.get(name)
+        if handler is None:
+            raise ValueError(f"未知的工具: {name}")
+        
+        result = handler(arguments)
+    except Exception as e:
+        # SDK会把异常转换为isError结果但不记录日志，这里保留服务端的错误记录
+        elapsed_us = (time.perf_counter_ns() - start) // 1000
+        logger.error(
+            "工具调用: %s, ok=False, 耗时: %dus, 错误: %s",
+            name, elapsed_us, e
+        )
+        raise
+    
+    logger.debug("返回结果: %s", result)
+    elapsed_us = (time.perf_counter_ns() - start) // 1000
+    logger.info("工具调用: %s, ok=True, 耗时: %dus", name, elapsed_us)
+    return result
+
+
+# 后台日志监听器，进程内只启动一次
+_log_listener = None
+
+
+def _start_log_listener():
+    """
+    将写stderr移到后台线程：记录的复制和格式化仍在调用线程完成，
+    但请求处理路径不再执行阻塞的stderr写入
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return
+    
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    listener = logging.handlers.QueueListener(
+        log_queue, *root.handlers, respect_handler_level=True
+    )
+    root.handlers = [logging.handlers.QueueHandler(log_queue)]
+    listener.start()
+    atexit.register(listener.stop)
+    _log_listener = listener
 
 
 def main():
     """
     主函数：运行stdio服务器
     """
+    _start_log_listener()
+    
     async def run():
         async with stdio_server() as (read_stream, write_stream):
             await app.run(
@@ -96,7 +154,16 @@ def main():
                 app.create_initialization_options()
             )
     
-    asyncio.run(run())
+    try:
+        import uvloop
+    except ImportError:  # 可选依赖，Windows上不可用
+        uvloop = None
+    
+    # 如果安装了uvloop，使用它运行事件循环
+    if uvloop is not None:
+        uvloop.run(run())
+    else:
+        asyncio.run(run())
 
 
 if __name__ == "__main__":
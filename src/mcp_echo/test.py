@@ -15,56 +15,78 @@ from mcp.types import Tool, TextContent
 app = Server("echo-server")
 
 
+# 工具列表是静态的，只在导入时构建一次
+_TOOLS = [
+    Tool(
+        name="echo",
+        description="输入什么就返回什么的echo工具。可以用来测试MCP连接或简单地回显文本。",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "message": {
+                    "type": "string",
+                    "description": "要回显的消息内容"
+                },
+                "delay": {
+                    "type": "integer",
+                    "description": "延迟秒数，用于测试并发场景",
+                    "default": 0,
+                    "minimum": 0
+                }
+            },
+            "required": ["message"]
+        }
+    )
+]
+
+
 @app.list_tools()
 async def list_tools() -> list[Tool]:
     """
     列出可用的工具
     """
+    return _TOOLS
+
+
+async def echo(arguments: dict) -> list[TextContent]:
+    """
+    echo工具：可选延迟后原样返回message参数
+    """
+    # message是schema中的必填参数，直接取值
+    try:
+        message = arguments["message"]
+    except KeyError:
+        raise ValueError("缺少必填参数: message") from None
+    delay = arguments.get("delay", 0)
+    
+    # 如果设置了延迟，则等待指定的秒数
+    if delay > 0:
+        await asyncio.sleep(delay)
+    
     return [
-        Tool(
-            name="echo",
-            description="输入什么就返回什么的echo工具。可以用来测试MCP连接或简单地回显文本。",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "message": {
-                        "type": "string",
-                        "description": "要回显的消息内容"
-                    },
-                    "delay": {
-                        "type": "integer",
-                        "description": "延迟秒数，用于测试并发场景",
-                        "default": 0,
-                        "minimum": 0
-                    }
-                },
-                "required": ["message"]
-            }
+        TextContent(
+            type="text",
+            text=message
         )
     ]
 
 
+# 工具名称到处理函数的映射
+_TOOL_HANDLERS = {
+    "echo": echo,
+}
+
+
 @app.call_tool()
 async def call_tool(name: str, arguments: dict) -> list[TextContent]:
     """
     处理工具调用
     """
-    if name == "echo":
-        message = arguments.get("message", "")
-        delay = arguments.get("delay", 0)
-        
-        # 如果设置了延迟，则等待指定的秒数
-        if delay > 0:
-            await asyncio.sleep(delay)
-        
-        return [
-            TextContent(
-                type="text",
-                text=message
-            )
-        ]
-    else:
+    handler = _TOOL_HANDLERS.get(name)
+    if handler is None:
         raise ValueError(f"未知的工具: {name}")
+    
+    return await handler(arguments)
 
 
 def main():